@@ -12,18 +12,87 @@ This allows you to:
 - Debug API interactions
 """
 
-from flask import Flask, jsonify, request, Response
-from functools import wraps
-import json
+from flask import Flask, request, Response
+from flask_compress import Compress
+from functools import lru_cache, wraps
+import gc
+import ijson
+import logging
+import mmap
+import orjson
 import os
+import subprocess
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 app = Flask(__name__)
 
-# Configuration
+# Don't sort keys or pretty-print JSON responses: key sorting burns CPU on
+# large message payloads and indentation inflates the wire size. Keys come
+# out in insertion order (guaranteed since Python 3.7), which clients accept.
+app.config['JSON_SORT_KEYS'] = False
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+if hasattr(app, 'json'):  # Flask >= 2.2
+    app.json.sort_keys = False
+    app.json.compact = True
+
+# Compress JSON bodies over 1 KiB (brotli preferred, gzip fallback, honoring
+# Accept-Encoding): message pages repeat the same keys across every message
+# and typically shrink 5-10x on the wire
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
+# The workload is mostly-static data served from memory, so collect rarely:
+# frequent gen-0 sweeps would just walk the same long-lived objects
+gc.set_threshold(100_000, 50, 50)
+
+# Configuration - resolved once at import so the per-request auth check is a
+# header fetch plus a string compare, with no environ lookups in the hot path
 DATA_DIR = os.environ.get('OFW_DATA_DIR', '../debug')
 AUTH_TOKEN = os.environ.get('OFW_AUTH_TOKEN', 'mock_auth_token_12345')
+STRICT_AUTH = os.environ.get('OFW_STRICT_AUTH') == 'true'
+EXPECTED_BEARER = f'Bearer {AUTH_TOKEN}'
+
+# Default folders served when no folders.json is present
+DEFAULT_FOLDERS = {
+    'systemFolders': [
+        {
+            'id': 1,
+            'name': 'Inbox',
+            'folderOrder': 1,
+            'totalMessageCount': 0,
+            'unreadMessageCount': 0,
+            'folderType': 'INBOX'
+        },
+        {
+            'id': 2,
+            'name': 'Action Items',
+            'folderOrder': 2,
+            'totalMessageCount': 0,
+            'unreadMessageCount': 0,
+            'folderType': 'ACTION_ITEMS'
+        },
+        {
+            'id': 3,
+            'name': 'Notifications',
+            'folderOrder': 3,
+            'totalMessageCount': 0,
+            'unreadMessageCount': 0,
+            'folderType': 'SYSTEM_MESSAGES'
+        }
+    ],
+    'userFolders': []
+}
+
+# Default localStorage payload served when no localstorage_data.json is present
+DEFAULT_LOCALSTORAGE = {
+    'userId': 123456,
+    'firstName': 'Mock',
+    'lastName': 'User'
+}
 
 # In-memory data store (loaded from files)
 data_store = {
@@ -31,8 +100,38 @@ data_store = {
     'messages': {},  # folder_id -> list of messages
     'full_messages': {},  # message_id -> full message
     'localstorage': None,
+    '_cache': {},  # pre-serialized JSON bytes, rebuilt by load_data()
+    '_version': 0,  # bumped by load_data(); used for weak ETags
+    '_msgs': [],  # flat list of all messages, position-indexed
+    '_idx_by_id': {},  # message_id -> position in _msgs
+    '_page_cache': {},  # folder_id -> {(size, page): serialized page bytes}
+    '_msg_bytes': {},  # folder_id -> [orjson-encoded message bytes]
 }
 
+# Page sizes pre-rendered into the pagination cache at load time
+COMMON_PAGE_SIZES = (10, 25, 50)
+
+
+def ojson(obj, status=200):
+    """Serialize obj with orjson and wrap it in a JSON Response.
+
+    Faster than flask.jsonify: orjson emits bytes directly, skipping the
+    stdlib encoder and Flask's per-request json wrapping.
+    """
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
+def _load_json(path):
+    """Parse a JSON file through a read-only mmap.
+
+    orjson parses straight out of the mapped pages via a zero-copy
+    memoryview, skipping the userspace copy a read() would make and letting
+    the kernel page the file in lazily.
+    """
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return orjson.loads(memoryview(mm))
+
 
 def load_data():
     """Load data from JSON files in the data directory."""
@@ -43,97 +142,202 @@ def load_data():
     # Load folders
     folders_file = data_path / 'folders.json'
     if folders_file.exists():
-        with open(folders_file, 'r') as f:
-            data_store['folders'] = json.load(f)
+        data_store['folders'] = _load_json(folders_file)
         print(f"✓ Loaded folders from {folders_file}")
     
     # Load messages
     messages_file = data_path / 'messages.json'
     if messages_file.exists():
-        with open(messages_file, 'r') as f:
-            messages_data = json.load(f)
-            # Extract folder_id from first message if available
-            if messages_data.get('data'):
-                folder_id = messages_data['data'][0].get('folder')
-                data_store['messages'][folder_id] = messages_data
+        messages_data = _load_json(messages_file)
+        # Extract folder_id from first message if available
+        if messages_data.get('data'):
+            folder_id = messages_data['data'][0].get('folder')
+            data_store['messages'][folder_id] = messages_data
         print(f"✓ Loaded messages from {messages_file}")
     
-    # Load all messages (if exists)
+    # Load all messages (if exists). This can be the largest file by far, so
+    # stream it one message at a time rather than materializing the raw bytes
+    # plus the full object tree at once; the other files stay on orjson since
+    # they're small enough that incremental parsing isn't worth the overhead
     all_messages_file = data_path / 'all_messages.json'
     if all_messages_file.exists():
-        with open(all_messages_file, 'r') as f:
-            all_messages = json.load(f)
-            # Group by folder
-            if all_messages:
-                for msg in all_messages:
-                    folder_id = msg.get('folder')
-                    if folder_id not in data_store['messages']:
-                        data_store['messages'][folder_id] = {'data': [], 'metadata': {}}
-                    if isinstance(data_store['messages'][folder_id], dict):
-                        data_store['messages'][folder_id]['data'].append(msg)
+        with open(all_messages_file, 'rb') as f:
+            # Group by folder (use_float avoids Decimals orjson can't encode)
+            for msg in ijson.items(f, 'item', use_float=True):
+                folder_id = msg.get('folder')
+                bucket = data_store['messages'].setdefault(
+                    folder_id, {'data': [], 'metadata': {}})
+                if isinstance(bucket, dict):
+                    bucket['data'].append(msg)
         print(f"✓ Loaded all messages from {all_messages_file}")
     
     # Load full message (if exists)
     full_message_file = data_path / 'full_message.json'
     if full_message_file.exists():
-        with open(full_message_file, 'r') as f:
-            full_msg = json.load(f)
-            msg_id = full_msg.get('id')
-            if msg_id:
-                data_store['full_messages'][msg_id] = full_msg
+        full_msg = _load_json(full_message_file)
+        msg_id = full_msg.get('id')
+        if msg_id:
+            data_store['full_messages'][msg_id] = full_msg
         print(f"✓ Loaded full message from {full_message_file}")
     
     # Load localstorage
     localstorage_file = data_path / 'localstorage_data.json'
     if localstorage_file.exists():
-        with open(localstorage_file, 'r') as f:
-            data_store['localstorage'] = json.load(f)
+        data_store['localstorage'] = _load_json(localstorage_file)
         print(f"✓ Loaded localstorage from {localstorage_file}")
     
+    # Flat message index: one position-indexed list plus an id -> position
+    # dict, so get_message hashes the id once and indexes straight into the
+    # list instead of holding a second id -> dict mapping per message
+    msgs = []
+    idx_by_id = {}
+    for fm in data_store['messages'].values():
+        if not (isinstance(fm, dict) and 'data' in fm):
+            continue
+        for m in fm['data']:
+            if 'id' in m:
+                idx_by_id[m['id']] = len(msgs)
+                msgs.append(m)
+    data_store['_msgs'] = msgs
+    data_store['_idx_by_id'] = idx_by_id
+
+    # Encode each message once; pages (cached or streamed) are assembled by
+    # concatenating these instead of re-serializing the message dicts
+    msg_bytes = {}
+    for folder_id, messages_data in data_store['messages'].items():
+        if isinstance(messages_data, dict) and 'data' in messages_data:
+            msg_bytes[folder_id] = [orjson.dumps(m) for m in messages_data['data']]
+    data_store['_msg_bytes'] = msg_bytes
+
+    # Pre-render every page of the common page sizes per folder, so the hot
+    # (folder, page, size) combinations skip slicing and encoding entirely
+    page_cache = {}
+    for folder_id, encoded in msg_bytes.items():
+        pages = {}
+        for size in COMMON_PAGE_SIZES:
+            n_pages = -(-len(encoded) // size)  # ceil division
+            for page in range(1, n_pages + 1):
+                start_idx = (page - 1) * size
+                end_idx = start_idx + size
+                page_enc = encoded[start_idx:end_idx]
+                meta = {
+                    'page': page,
+                    'count': len(page_enc),
+                    'first': page == 1,
+                    'last': end_idx >= len(encoded)
+                }
+                pages[(size, page)] = (b'{"metadata":' + orjson.dumps(meta) +
+                                       b',"data":[' + b','.join(page_enc) + b']}')
+        page_cache[folder_id] = pages
+    data_store['_page_cache'] = page_cache
+
+    # Bump the data version so cached clients revalidate after a reload
+    data_store['_version'] += 1
+
+    # Pre-serialize payloads that only change on reload, so the cache-hot
+    # endpoints can return ready-made bytes instead of re-encoding per request
+    cache = data_store['_cache']
+    cache.clear()
+    cache['folders'] = orjson.dumps(data_store['folders'] or DEFAULT_FOLDERS)
+    merged = (data_store['localstorage'] or DEFAULT_LOCALSTORAGE).copy()
+    merged.setdefault('auth', AUTH_TOKEN)
+    cache['localstorage'] = orjson.dumps(merged)
+    cache['health'] = orjson.dumps({
+        'status': 'ok',
+        'service': 'ofw-mock-server',
+        'data_loaded': {
+            'folders': data_store['folders'] is not None,
+            'messages': len(data_store['messages']) > 0,
+            'full_messages': len(data_store['full_messages']) > 0,
+        }
+    })
+
     print(f"\n✓ Data loaded from {DATA_DIR}")
     print(f"  Folders: {'Yes' if data_store['folders'] else 'No'}")
     print(f"  Message folders: {len(data_store['messages'])}")
     print(f"  Full messages: {len(data_store['full_messages'])}")
     print(f"  LocalStorage: {'Yes' if data_store['localstorage'] else 'No'}")
 
+    # Freeze the loaded objects into the permanent generation: GC traversals
+    # skip them, so under a pre-forking server their refcount/gc-header bytes
+    # stay untouched and the CoW pages remain shared across workers
+    gc.collect()
+    gc.freeze()
+
+
+def _stream_page(meta, encoded_msgs):
+    """Yield a JSON message page piecewise from pre-encoded message bytes.
+
+    Flask sends generator bodies with chunked transfer encoding, so the page
+    is never assembled into one contiguous buffer and the first bytes hit the
+    wire before the last message is reached.
+    """
+    yield b'{"metadata":' + orjson.dumps(meta) + b',"data":['
+    sep = b''
+    for enc in encoded_msgs:
+        yield sep + enc
+        sep = b','
+    yield b']}'
+
+
+def not_modified():
+    """True if the client's If-None-Match matches the current data version."""
+    return request.if_none_match.contains_weak(str(data_store['_version']))
+
+
+def with_etag(resp):
+    """Attach a weak ETag (current data version) and cache headers to resp.
+
+    Lets clients revalidate with If-None-Match and get a body-less 304 until
+    the next /reload bumps the version.
+    """
+    resp.set_etag(str(data_store['_version']), weak=True)
+    resp.cache_control.max_age = 60
+    return resp
+
 
-def require_auth(f):
-    """Decorator to require Bearer token authentication."""
+# Auth failure responses are constant - build them once, not per request
+_NO_AUTH_RESP = ojson({'error': 'No Authorization header'}, status=401)
+_BAD_TOKEN_RESP = ojson({'error': 'Invalid token'}, status=401)
+_BAD_FORMAT_RESP = ojson({'error': 'Invalid Authorization header format'}, status=401)
+_MSG_NOT_FOUND_RESP = ojson({'error': 'Message not found'}, status=404)
+
+
+def require_ofw(f):
+    """Decorator to require Bearer token auth and log OFW-specific headers.
+
+    Single fused wrapper so each request pays for one decorator frame
+    instead of two stacked ones.
+    """
     @wraps(f)
     def decorated_function(*args, **kwargs):
         auth_header = request.headers.get('Authorization')
-        
-        if not auth_header:
-            return jsonify({'error': 'No Authorization header'}), 401
-        
-        if not auth_header.startswith('Bearer '):
-            return jsonify({'error': 'Invalid Authorization header format'}), 401
-        
-        token = auth_header[7:]  # Remove 'Bearer ' prefix
-        
-        # For mock server, accept any token (or check against AUTH_TOKEN)
+
+        if auth_header is None:
+            return _NO_AUTH_RESP
+
+        # For mock server, accept any token unless strict auth is enabled.
         # In production, you'd validate the token properly
-        if token != AUTH_TOKEN and os.environ.get('OFW_STRICT_AUTH') == 'true':
-            return jsonify({'error': 'Invalid token'}), 401
-        
-        return f(*args, **kwargs)
-    
-    return decorated_function
+        if STRICT_AUTH and auth_header != EXPECTED_BEARER:
+            return _BAD_TOKEN_RESP
 
+        if auth_header[:7] != 'Bearer ':
+            return _BAD_FORMAT_RESP
+
+        # Checked per request (the level can change after import, e.g. when
+        # app.run(debug=True) reconfigures the logger); when INFO logging is
+        # off this still skips the header fetches and log-string formatting
+        if app.logger.isEnabledFor(logging.INFO):
+            ofw_client = request.headers.get('ofw-client')
+            ofw_version = request.headers.get('ofw-version')
+
+            # Just log them, don't enforce (for flexibility)
+            if ofw_client or ofw_version:
+                app.logger.info('OFW Headers - Client: %s, Version: %s',
+                                ofw_client, ofw_version)
 
-def require_ofw_headers(f):
-    """Decorator to check for OFW-specific headers."""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        ofw_client = request.headers.get('ofw-client')
-        ofw_version = request.headers.get('ofw-version')
-        
-        # Just log them, don't enforce (for flexibility)
-        if ofw_client or ofw_version:
-            app.logger.info(f"OFW Headers - Client: {ofw_client}, Version: {ofw_version}")
-        
         return f(*args, **kwargs)
-    
+
     return decorated_function
 
 
@@ -142,7 +346,11 @@ def require_ofw_headers(f):
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
+    cached = data_store['_cache'].get('health')
+    if cached is not None:
+        return Response(cached, mimetype='application/json')
+
+    return ojson({
         'status': 'ok',
         'service': 'ofw-mock-server',
         'data_loaded': {
@@ -156,68 +364,37 @@ def health_check():
 @app.route('/ofw/appv2/localstorage.json', methods=['GET'])
 def get_localstorage():
     """Return localStorage data."""
-    if data_store['localstorage']:
-        # Return the actual localstorage data
-        response_data = data_store['localstorage'].copy()
-        # Ensure auth token is set
-        if 'auth' not in response_data:
-            response_data['auth'] = AUTH_TOKEN
-        return jsonify(response_data)
-    else:
-        # Return minimal localstorage with auth token
-        return jsonify({
-            'auth': AUTH_TOKEN,
-            'userId': 123456,
-            'firstName': 'Mock',
-            'lastName': 'User'
-        })
+    if not_modified():
+        return Response(status=304)
+
+    cached = data_store['_cache'].get('localstorage')
+    if cached is not None:
+        return with_etag(Response(cached, mimetype='application/json'))
+
+    # Cache is cold (data never loaded) - build the payload per request
+    merged = (data_store['localstorage'] or DEFAULT_LOCALSTORAGE).copy()
+    merged.setdefault('auth', AUTH_TOKEN)
+    return with_etag(ojson(merged))
 
 
 @app.route('/pub/v1/messageFolders', methods=['GET'])
-@require_auth
-@require_ofw_headers
+@require_ofw
 def get_folders():
     """Return message folders."""
     include_counts = request.args.get('includeFolderCounts', 'true').lower() == 'true'
-    
-    if data_store['folders']:
-        return jsonify(data_store['folders'])
-    else:
-        # Return default folders
-        return jsonify({
-            'systemFolders': [
-                {
-                    'id': 1,
-                    'name': 'Inbox',
-                    'folderOrder': 1,
-                    'totalMessageCount': 0,
-                    'unreadMessageCount': 0,
-                    'folderType': 'INBOX'
-                },
-                {
-                    'id': 2,
-                    'name': 'Action Items',
-                    'folderOrder': 2,
-                    'totalMessageCount': 0,
-                    'unreadMessageCount': 0,
-                    'folderType': 'ACTION_ITEMS'
-                },
-                {
-                    'id': 3,
-                    'name': 'Notifications',
-                    'folderOrder': 3,
-                    'totalMessageCount': 0,
-                    'unreadMessageCount': 0,
-                    'folderType': 'SYSTEM_MESSAGES'
-                }
-            ],
-            'userFolders': []
-        })
+
+    if not_modified():
+        return Response(status=304)
+
+    cached = data_store['_cache'].get('folders')
+    if cached is not None:
+        return with_etag(Response(cached, mimetype='application/json'))
+
+    return with_etag(ojson(data_store['folders'] or DEFAULT_FOLDERS))
 
 
 @app.route('/pub/v3/messages', methods=['GET'])
-@require_auth
-@require_ofw_headers
+@require_ofw
 def get_messages():
     """Return messages for a folder."""
     folder_id = request.args.get('folders', type=int)
@@ -226,6 +403,14 @@ def get_messages():
     sort = request.args.get('sort', 'date')
     sort_direction = request.args.get('sortDirection', 'desc')
     
+    # Serve pre-rendered bytes for common (folder, page, size) combinations.
+    # Only for a valid folder param: the load-time buckets can include a
+    # None-keyed folder, which must not be served for a missing ?folders=
+    if folder_id:
+        cached = data_store['_page_cache'].get(folder_id, {}).get((size, page))
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
+
     # Get messages for this folder
     if folder_id and folder_id in data_store['messages']:
         messages_data = data_store['messages'][folder_id]
@@ -235,23 +420,32 @@ def get_messages():
             all_msgs = messages_data['data']
             start_idx = (page - 1) * size
             end_idx = start_idx + size
-            page_msgs = all_msgs[start_idx:end_idx]
-            
-            return jsonify({
-                'metadata': {
-                    'page': page,
-                    'count': len(page_msgs),
-                    'first': page == 1,
-                    'last': end_idx >= len(all_msgs)
-                },
-                'data': page_msgs
-            })
+
+            # Slice first so metadata.count always matches the data actually
+            # returned, including for out-of-range or non-positive pages
+            encoded = data_store['_msg_bytes'].get(folder_id)
+            page_items = (encoded if encoded is not None
+                          else all_msgs)[start_idx:end_idx]
+            meta = {
+                'page': page,
+                'count': len(page_items),
+                'first': page == 1,
+                'last': end_idx >= len(all_msgs)
+            }
+
+            # Stream pre-encoded message bytes so uncommon page sizes don't
+            # build the whole page in memory before sending
+            if encoded is not None:
+                return Response(_stream_page(meta, page_items),
+                                mimetype='application/json')
+
+            return ojson({'metadata': meta, 'data': page_items})
         else:
             # Old format - return as-is
-            return jsonify(messages_data)
+            return ojson(messages_data)
     else:
         # No messages for this folder
-        return jsonify({
+        return ojson({
             'metadata': {
                 'page': page,
                 'count': 0,
@@ -262,39 +456,54 @@ def get_messages():
         })
 
 
+@lru_cache(maxsize=1024)
+def _render_message(message_id: int) -> Optional[bytes]:
+    """Render a message from the id index to JSON bytes, or None if unknown.
+
+    Memoized: repeated hits for the same id return the ready-made bytes
+    without re-copying the dict or re-encoding. Cleared on /reload.
+    """
+    pos = data_store['_idx_by_id'].get(message_id)
+    if pos is None:
+        return None
+    # Return with mock body if not present
+    result = data_store['_msgs'][pos].copy()
+    if 'body' not in result:
+        result['body'] = f"This is a mock message body for message {message_id}."
+    return orjson.dumps(result)
+
+
 @app.route('/pub/v3/messages/<int:message_id>', methods=['GET'])
-@require_auth
-@require_ofw_headers
+@require_ofw
 def get_message(message_id):
     """Return a single message by ID."""
+    if not_modified():
+        return Response(status=304)
+
     if message_id in data_store['full_messages']:
-        return jsonify(data_store['full_messages'][message_id])
+        return with_etag(ojson(data_store['full_messages'][message_id]))
     else:
-        # Try to find it in the messages lists
-        for folder_msgs in data_store['messages'].values():
-            if isinstance(folder_msgs, dict) and 'data' in folder_msgs:
-                for msg in folder_msgs['data']:
-                    if msg.get('id') == message_id:
-                        # Return with mock body if not present
-                        result = msg.copy()
-                        if 'body' not in result:
-                            result['body'] = f"This is a mock message body for message {message_id}."
-                        return jsonify(result)
-        
-        return jsonify({'error': 'Message not found'}), 404
+        # Fall back to the id index built at load time
+        body = _render_message(message_id)
+        if body is not None:
+            return with_etag(Response(body, mimetype='application/json'))
+
+        return _MSG_NOT_FOUND_RESP
 
 
 @app.route('/reload', methods=['POST'])
 def reload_data():
     """Reload data from files (useful for development)."""
+    data_store['_cache'].clear()
+    _render_message.cache_clear()
     load_data()
-    return jsonify({'status': 'ok', 'message': 'Data reloaded'})
+    return ojson({'status': 'ok', 'message': 'Data reloaded'})
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({
+    return ojson({
         'error': 'Endpoint not found',
         'path': request.path,
         'available_endpoints': [
@@ -305,16 +514,25 @@ def not_found(error):
             '/pub/v3/messages/<id>',
             '/reload'
         ]
-    }), 404
+    }, status=404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({
+    return ojson({
         'error': 'Internal server error',
         'message': str(error)
-    }), 500
+    }, status=500)
+
+
+# Load data at import time so pre-forking servers (gunicorn, especially with
+# --preload) parse the JSON files once and the forked workers share the
+# read-only data_store pages via copy-on-write, instead of each worker
+# re-reading and re-parsing every file. Set OFW_SKIP_LOAD=true (before
+# import) to get an empty store, e.g. for tests that load their own data.
+if os.environ.get('OFW_SKIP_LOAD', '').lower() != 'true':
+    load_data()
 
 
 def main():
@@ -326,10 +544,8 @@ def main():
     print(f"Data directory: {DATA_DIR}")
     print(f"Auth token: {AUTH_TOKEN}")
     print()
-    
-    # Load data from files
-    load_data()
-    
+
+    # Data is loaded at import time (module scope) so forked workers share it
     print()
     print("="*70)
     print("Starting server...")
@@ -350,8 +566,23 @@ def main():
     # Run server
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_DEBUG', 'true').lower() == 'true'
-    
-    app.run(host='0.0.0.0', port=port, debug=debug)
+
+    if debug:
+        app.run(host='0.0.0.0', port=port, debug=True)
+    else:
+        # Werkzeug's dev server is single-threaded and serializes requests;
+        # gunicorn with gevent workers multiplexes thousands of greenlets
+        # per worker. Workers import app.py, so data must be loaded at
+        # module scope for each worker to see it (not inside main()).
+        workers = 2 * (os.cpu_count() or 1) + 1
+        subprocess.run([
+            'gunicorn',
+            '-k', 'gevent',
+            '-w', str(workers),
+            '--worker-connections', '1000',
+            '-b', f'0.0.0.0:{port}',
+            'app:app',
+        ])
 
 
 if __name__ == '__main__':
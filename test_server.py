@@ -18,6 +18,13 @@ HEADERS = {
     'Content-Type': 'application/json'
 }
 
+# One session shared by all tests: keep-alive reuses the TCP connection to
+# the server instead of setting up a fresh one per request
+SESSION = requests.Session()
+SESSION.mount('http://', requests.adapters.HTTPAdapter(
+    pool_connections=10, pool_maxsize=10, max_retries=3))
+SESSION.headers.update(HEADERS)
+
 
 def test_health():
     """Test health check endpoint."""
@@ -25,7 +32,7 @@ def test_health():
     print("TEST: Health Check")
     print("="*70)
     
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     
@@ -39,7 +46,7 @@ def test_localstorage():
     print("TEST: LocalStorage")
     print("="*70)
     
-    response = requests.get(f"{BASE_URL}/ofw/appv2/localstorage.json")
+    response = SESSION.get(f"{BASE_URL}/ofw/appv2/localstorage.json")
     print(f"Status: {response.status_code}")
     data = response.json()
     print(f"Response: {json.dumps(data, indent=2)}")
@@ -57,9 +64,8 @@ def test_folders():
     print("TEST: Folders")
     print("="*70)
     
-    response = requests.get(
-        f"{BASE_URL}/pub/v1/messageFolders?includeFolderCounts=true",
-        headers=HEADERS
+    response = SESSION.get(
+        f"{BASE_URL}/pub/v1/messageFolders?includeFolderCounts=true"
     )
     print(f"Status: {response.status_code}")
     data = response.json()
@@ -90,7 +96,7 @@ def test_messages(folder_id):
         print("⚠ No folder ID, skipping")
         return None
     
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/pub/v3/messages",
         params={
             'folders': folder_id,
@@ -98,8 +104,7 @@ def test_messages(folder_id):
             'size': 10,
             'sort': 'date',
             'sortDirection': 'desc'
-        },
-        headers=HEADERS
+        }
     )
     print(f"Status: {response.status_code}")
     data = response.json()
@@ -137,9 +142,8 @@ def test_single_message(message_id):
         print("⚠ No message ID, skipping")
         return
     
-    response = requests.get(
-        f"{BASE_URL}/pub/v3/messages/{message_id}",
-        headers=HEADERS
+    response = SESSION.get(
+        f"{BASE_URL}/pub/v3/messages/{message_id}"
     )
     print(f"Status: {response.status_code}")
     
@@ -160,7 +164,7 @@ def test_reload():
     print("TEST: Reload Data")
     print("="*70)
     
-    response = requests.post(f"{BASE_URL}/reload")
+    response = SESSION.post(f"{BASE_URL}/reload")
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     
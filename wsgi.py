@@ -0,0 +1,12 @@
+"""
+WSGI entry point for the OFW Mock Server.
+
+Used by production WSGI servers, e.g.:
+
+    gunicorn -k gevent -w 4 wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run()